@@ -18,6 +18,7 @@ DELETE /api/dataset/{id}                -> DELETE /api/datasets/{id}
 """
 from fastapi import APIRouter, HTTPException, Header, Request, Query
 from pydantic import BaseModel, Field
+import orjson
 from typing import Optional, List, Dict, Any
 import secrets
 import json
@@ -41,6 +42,7 @@ from database import (
     record_dataset_usage,
     check_dataset_first_map_usage,
     increment_download_count,
+    get_dataset_spatial_index,
 )
 from api.contributions import get_points_multiplier
 
@@ -162,6 +164,15 @@ def generate_dataset_id() -> str:
     return "ds_" + secrets.token_urlsafe(16)
 
 
+def _json_size(data: dict) -> int:
+    """Size of data as compact UTF-8 JSON, in bytes."""
+    try:
+        return len(orjson.dumps(data))
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits; stdlib json doesn't
+        return len(json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode())
+
+
 def validate_geojson(data: dict) -> dict:
     """Validate and normalize GeoJSON, return computed metadata."""
     if data.get("type") != "FeatureCollection":
@@ -174,7 +185,7 @@ def validate_geojson(data: dict) -> dict:
         raise HTTPException(status_code=400, detail="Maximum 100,000 features per dataset")
 
     # Check file size
-    data_size = len(json.dumps(data))
+    data_size = _json_size(data)
     if data_size > MAX_FILE_SIZE_BYTES:
         raise HTTPException(
             status_code=400,
@@ -817,11 +828,9 @@ async def get_dataset_geojson_compat(
             parts = [float(x) for x in bbox.split(",")]
             if len(parts) == 4:
                 w, s, e, n = parts
-                filtered_features = []
-                for f in geojson.get("features", []):
-                    geom = f.get("geometry", {})
-                    if _feature_in_bbox(geom, w, s, e, n):
-                        filtered_features.append(f)
+                filtered_features = _features_in_bbox(
+                    dataset_id, geojson.get("features", []), w, s, e, n
+                )
                 geojson = {"type": "FeatureCollection", "features": filtered_features}
         except (ValueError, TypeError):
             pass
@@ -929,26 +938,24 @@ async def query_dataset(
 
     # --- Apply filters ---
 
-    # Geometry type filter
-    if geometry_type:
-        features = [
-            f for f in features
-            if f.get("geometry", {}).get("type") == geometry_type
-        ]
-
-    # Bounding box filter
+    # Bounding box filter (first, while features still line up with the
+    # dataset's persisted spatial index)
     if bbox:
         try:
             parts = [float(x) for x in bbox.split(",")]
             if len(parts) == 4:
                 w, s, e, n = parts
-                features = [
-                    f for f in features
-                    if _feature_in_bbox(f.get("geometry", {}), w, s, e, n)
-                ]
+                features = _features_in_bbox(dataset_id, features, w, s, e, n)
         except (ValueError, TypeError):
             raise HTTPException(status_code=400, detail="Invalid bbox format. Expected: west,south,east,north")
 
+    # Geometry type filter
+    if geometry_type:
+        features = [
+            f for f in features
+            if f.get("geometry", {}).get("type") == geometry_type
+        ]
+
     # Property filters
     if where:
         for clause in where.split(","):
@@ -1230,6 +1237,26 @@ async def delete_dataset_compat(
 
 # ==================== HELPERS ====================
 
+def _features_in_bbox(dataset_id: str, features: list,
+                      w: float, s: float, e: float, n: float) -> list:
+    """Filter a dataset's features to those with a coordinate in the bbox.
+
+    If the dataset has a persisted spatial index (seeded datasets), its
+    STRtree narrows the scan to features whose envelope meets the bbox;
+    the per-vertex check still decides, so results match the full scan.
+    """
+    candidates = features
+    tree = get_dataset_spatial_index(dataset_id)
+    if tree is not None:
+        # Tree indices count only the features that have a geometry
+        with_geom = [f for f in features if f.get("geometry")]
+        if len(with_geom) == len(tree.geometries):
+            from shapely.geometry import box
+            hits = sorted(tree.query(box(w, s, e, n)))
+            candidates = [with_geom[i] for i in hits]
+    return [f for f in candidates if _feature_in_bbox(f.get("geometry") or {}, w, s, e, n)]
+
+
 def _feature_in_bbox(geom: dict, w: float, s: float, e: float, n: float) -> bool:
     """Check if any coordinate of a geometry falls within a bounding box."""
     coords = _flat_coords(geom)
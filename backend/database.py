@@ -2,12 +2,15 @@
 Spatix Database Module
 PostgreSQL for auth and user management, map storage
 """
+import io
 import os
 import json
 import logging
 from contextlib import contextmanager
 from datetime import datetime, timezone
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
@@ -233,6 +236,8 @@ def init_db():
                     ALTER TABLE datasets ADD COLUMN IF NOT EXISTS creator_type VARCHAR(20);
                     ALTER TABLE datasets ADD COLUMN IF NOT EXISTS creator_id VARCHAR(100);
                     ALTER TABLE datasets ADD COLUMN IF NOT EXISTS creator_name VARCHAR(200);
+                    ALTER TABLE datasets ADD COLUMN IF NOT EXISTS coords_e7 BYTEA;
+                    ALTER TABLE datasets ADD COLUMN IF NOT EXISTS spatial_index BYTEA;
 
                     -- Dataset usage tracking
                     CREATE TABLE IF NOT EXISTS dataset_usage (
@@ -483,6 +488,7 @@ def init_db():
                 "schema_def TEXT", "completeness REAL",
                 "download_count INTEGER DEFAULT 0",
                 "creator_type TEXT", "creator_id TEXT", "creator_name TEXT",
+                "coords_e7 BLOB", "spatial_index BLOB",
             ]:
                 try:
                     conn.execute(f"ALTER TABLE datasets ADD COLUMN {col}")
@@ -881,6 +887,72 @@ def get_maps_by_email(email: str, limit: int = 100, offset: int = 0) -> list:
 
 # ==================== DATASET REGISTRY ====================
 
+# Storage-only copy of every vertex as int32 degrees * 1e7 ("E7"), ~1cm
+# precision at 8 bytes per point. The GeoJSON in `data` stays canonical.
+COORD_E7_SCALE = 1e7
+
+
+def encode_coords_e7(lngs: list, lats: list) -> bytes | None:
+    """Pack parallel lng/lat lists into little-endian int32 E7 pairs.
+
+    Returns None if any position is outside lng [-180, 180] / lat [-90, 90]
+    (e.g. projected coordinates), since int32 would silently wrap them.
+    """
+    lngs = np.asarray(lngs, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    if not (np.all(np.abs(lngs) <= 180) and np.all(np.abs(lats) <= 90)):
+        return None
+    coords = np.column_stack((lngs, lats))
+    return np.round(coords * COORD_E7_SCALE).astype("<i4").tobytes()
+
+
+_DATASET_COLUMNS = (
+    "id", "uploader_id", "uploader_email", "agent_id", "agent_name",
+    "title", "description", "license", "category", "tags", "data",
+    "feature_count", "geometry_types", "bbox_west", "bbox_south", "bbox_east", "bbox_north",
+    "file_size_bytes", "source_name", "source_url", "license_type",
+    "attribution_required", "commercial_use", "region", "data_date",
+    "update_frequency", "schema_def", "completeness",
+    "creator_type", "creator_id", "creator_name", "coords_e7", "spatial_index",
+)
+
+# Columns get_dataset() returns: everything except the binary coords_e7 /
+# spatial_index blobs, so a metadata or GeoJSON fetch doesn't transfer them.
+_DATASET_SELECT_COLUMNS = ", ".join((
+    "id", "uploader_id", "uploader_email", "agent_id", "agent_name",
+    "title", "description", "license", "category", "tags", "data",
+    "feature_count", "geometry_types", "bbox_west", "bbox_south", "bbox_east", "bbox_north",
+    "file_size_bytes", "query_count", "used_in_maps", "public", "verified",
+    "reputation_score", "created_at", "updated_at",
+    "source_name", "source_url", "license_type", "attribution_required",
+    "commercial_use", "region", "data_date", "update_frequency", "schema_def",
+    "completeness", "download_count", "creator_type", "creator_id", "creator_name",
+))
+
+# Built once from _DATASET_COLUMNS so the single-row and bulk inserts share
+# one column list; this only deduplicates the SQL text.
+_PG_INSERT_DATASET_SQL = (
+    f"INSERT INTO datasets ({', '.join(_DATASET_COLUMNS)}) "
+    f"VALUES ({','.join(['%s'] * len(_DATASET_COLUMNS))})"
+)
+_SQLITE_INSERT_DATASET_SQL = (
+    f"INSERT INTO datasets ({', '.join(_DATASET_COLUMNS)}) "
+    f"VALUES ({','.join(['?'] * len(_DATASET_COLUMNS))})"
+)
+
+
+def _sqlite_dataset_params(ds: dict) -> tuple:
+    """Build SQLite insert parameters from create_dataset() kwargs."""
+    row = {**ds, "id": ds["dataset_id"]}
+    for key in ("data", "schema_def"):
+        if isinstance(row.get(key), (dict, list)):
+            row[key] = json.dumps(row[key])
+    row["attribution_required"] = 1 if row.get("attribution_required", False) else 0
+    row["commercial_use"] = 1 if row.get("commercial_use", True) else 0
+    row.setdefault("file_size_bytes", 0)
+    return tuple(row.get(col) for col in _DATASET_COLUMNS)
+
+
 def create_dataset(dataset_id: str, title: str, description: str, license: str,
                    category: str, tags: str, data: dict, feature_count: int,
                    geometry_types: str, bbox_west: float, bbox_south: float,
@@ -893,7 +965,8 @@ def create_dataset(dataset_id: str, title: str, description: str, license: str,
                    data_date: str = None, update_frequency: str = None,
                    schema_def: dict = None, completeness: float = None,
                    creator_type: str = None, creator_id: str = None,
-                   creator_name: str = None) -> bool:
+                   creator_name: str = None, coords_e7: bytes = None,
+                   spatial_index: bytes = None) -> bool:
     """Create a new dataset in the registry."""
     ensure_db_initialized()
     data_str = json.dumps(data) if isinstance(data, dict) else data
@@ -902,42 +975,73 @@ def create_dataset(dataset_id: str, title: str, description: str, license: str,
     with get_db() as conn:
         if USE_POSTGRES:
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO datasets (id, uploader_id, uploader_email, agent_id, agent_name,
-                        title, description, license, category, tags, data,
-                        feature_count, geometry_types, bbox_west, bbox_south, bbox_east, bbox_north,
-                        file_size_bytes, source_name, source_url, license_type,
-                        attribution_required, commercial_use, region, data_date,
-                        update_frequency, schema_def, completeness,
-                        creator_type, creator_id, creator_name)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-                """, (dataset_id, uploader_id, uploader_email, agent_id, agent_name,
-                      title, description, license, category, tags, data_str,
-                      feature_count, geometry_types, bbox_west, bbox_south, bbox_east, bbox_north,
-                      file_size_bytes, source_name, source_url, license_type,
-                      attribution_required, commercial_use, region, data_date,
-                      update_frequency, schema_str, completeness,
-                      creator_type, creator_id, creator_name))
-        else:
-            conn.execute("""
-                INSERT INTO datasets (id, uploader_id, uploader_email, agent_id, agent_name,
-                    title, description, license, category, tags, data,
+                cur.execute(_PG_INSERT_DATASET_SQL, (
+                    dataset_id, uploader_id, uploader_email, agent_id, agent_name,
+                    title, description, license, category, tags, data_str,
                     feature_count, geometry_types, bbox_west, bbox_south, bbox_east, bbox_north,
                     file_size_bytes, source_name, source_url, license_type,
                     attribution_required, commercial_use, region, data_date,
-                    update_frequency, schema_def, completeness,
-                    creator_type, creator_id, creator_name)
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """, (dataset_id, uploader_id, uploader_email, agent_id, agent_name,
-                  title, description, license, category, tags, data_str,
-                  feature_count, geometry_types, bbox_west, bbox_south, bbox_east, bbox_north,
-                  file_size_bytes, source_name, source_url, license_type,
-                  1 if attribution_required else 0, 1 if commercial_use else 0,
-                  region, data_date, update_frequency, schema_str, completeness,
-                  creator_type, creator_id, creator_name))
+                    update_frequency, schema_str, completeness,
+                    creator_type, creator_id, creator_name, coords_e7, spatial_index))
+        else:
+            conn.execute(_SQLITE_INSERT_DATASET_SQL, (
+                dataset_id, uploader_id, uploader_email, agent_id, agent_name,
+                title, description, license, category, tags, data_str,
+                feature_count, geometry_types, bbox_west, bbox_south, bbox_east, bbox_north,
+                file_size_bytes, source_name, source_url, license_type,
+                1 if attribution_required else 0, 1 if commercial_use else 0,
+                region, data_date, update_frequency, schema_str, completeness,
+                creator_type, creator_id, creator_name, coords_e7, spatial_index))
     return True
 
 
+def _copy_text_value(value) -> str:
+    """Encode a value for PostgreSQL text-format COPY."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, bytes):
+        return "\\\\x" + value.hex()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def bulk_create_datasets(datasets: list) -> int:
+    """Create many datasets at once. Each item takes create_dataset() kwargs.
+
+    On PostgreSQL the rows are streamed through a single COPY FROM STDIN;
+    on SQLite they go through a single executemany() transaction.
+    Returns the number of rows written.
+    """
+    if not datasets:
+        return 0
+    ensure_db_initialized()
+    if not USE_POSTGRES:
+        # One executemany in one transaction: the INSERT is prepared once,
+        # rows are bound in C, and get_db() commits (fsyncs) a single time.
+        with get_db() as conn:
+            conn.executemany(_SQLITE_INSERT_DATASET_SQL,
+                             [_sqlite_dataset_params(ds) for ds in datasets])
+        return len(datasets)
+
+    buf = io.StringIO()
+    for ds in datasets:
+        row = {**ds, "id": ds["dataset_id"]}
+        buf.write("\t".join(_copy_text_value(row.get(col)) for col in _DATASET_COLUMNS))
+        buf.write("\n")
+    buf.seek(0)
+
+    with get_db() as conn:
+        with conn.cursor() as cur:
+            cur.copy_expert(
+                f"COPY datasets ({', '.join(_DATASET_COLUMNS)}) FROM STDIN", buf
+            )
+    return len(datasets)
+
+
 def get_dataset(dataset_id: str) -> dict:
     """Get a dataset by ID."""
     ensure_db_initialized()
@@ -945,10 +1049,10 @@ def get_dataset(dataset_id: str) -> dict:
     with get_db() as conn:
         if USE_POSTGRES:
             with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute("SELECT * FROM datasets WHERE id = %s", (dataset_id,))
+                cur.execute(f"SELECT {_DATASET_SELECT_COLUMNS} FROM datasets WHERE id = %s", (dataset_id,))
                 row = cur.fetchone()
         else:
-            cur = conn.execute("SELECT * FROM datasets WHERE id = ?", (dataset_id,))
+            cur = conn.execute(f"SELECT {_DATASET_SELECT_COLUMNS} FROM datasets WHERE id = ?", (dataset_id,))
             row = cur.fetchone()
 
     if not row:
@@ -959,6 +1063,31 @@ def get_dataset(dataset_id: str) -> dict:
     return result
 
 
+def get_dataset_spatial_index(dataset_id: str):
+    """Load a dataset's persisted STRtree, or None if it has none.
+
+    Tree indices refer to the dataset's features that have a geometry,
+    in their original order.
+    """
+    import shapely
+    from shapely.strtree import STRtree
+
+    ensure_db_initialized()
+
+    with get_db() as conn:
+        if USE_POSTGRES:
+            with conn.cursor() as cur:
+                cur.execute("SELECT spatial_index FROM datasets WHERE id = %s", (dataset_id,))
+                row = cur.fetchone()
+        else:
+            cur = conn.execute("SELECT spatial_index FROM datasets WHERE id = ?", (dataset_id,))
+            row = cur.fetchone()
+
+    if not row or row[0] is None:
+        return None
+    return STRtree(shapely.get_parts(shapely.from_wkb(bytes(row[0]))))
+
+
 def dataset_exists(dataset_id: str) -> bool:
     """Check if a dataset ID already exists."""
     ensure_db_initialized()
@@ -972,6 +1101,25 @@ def dataset_exists(dataset_id: str) -> bool:
             return cur.fetchone() is not None
 
 
+def existing_dataset_ids(dataset_ids: list) -> set:
+    """Return the subset of dataset_ids that already exist, in one query."""
+    if not dataset_ids:
+        return set()
+    ensure_db_initialized()
+    ph = "%s" if USE_POSTGRES else "?"
+    q = f"SELECT id FROM datasets WHERE id IN ({','.join([ph] * len(dataset_ids))})"
+
+    with get_db() as conn:
+        if USE_POSTGRES:
+            with conn.cursor() as cur:
+                cur.execute(q, list(dataset_ids))
+                rows = cur.fetchall()
+        else:
+            rows = conn.execute(q, list(dataset_ids)).fetchall()
+
+    return {row[0] for row in rows}
+
+
 def search_datasets(query: str = None, category: str = None,
                     bbox_west: float = None, bbox_south: float = None,
                     bbox_east: float = None, bbox_north: float = None,
@@ -7,9 +7,11 @@ FastAPI backend for file processing and map storage.
 from fastapi import FastAPI, UploadFile, File, HTTPException, Query, BackgroundTasks, Request
 from fastapi.responses import JSONResponse, FileResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from contextlib import asynccontextmanager
 import os
+import zlib
 import shutil
 import tempfile
 import geopandas as gpd
@@ -119,6 +121,70 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+MAX_INFLATED_BODY_BYTES = 50 * 1024 * 1024  # 50MB, same as the upload limit
+
+
+class GzipRequestMiddleware:
+    """Inflate gzip-encoded request bodies (the MCP server gzips large POSTs)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if dict(scope["headers"]).get(b"content-encoding", b"").lower() != b"gzip":
+            await self.app(scope, receive, send)
+            return
+
+        reject = JSONResponse({"detail": "Invalid or oversized gzip request body"}, status_code=400)
+
+        # Cap the compressed body at the inflated limit too, so an oversized
+        # upload is rejected without buffering the rest of it.
+        body = bytearray()
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            if len(body) > MAX_INFLATED_BODY_BYTES:
+                await reject(scope, receive, send)
+                return
+            more_body = message.get("more_body", False)
+
+        inflater = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        try:
+            inflated = inflater.decompress(bytes(body), MAX_INFLATED_BODY_BYTES + 1)
+        except zlib.error:
+            inflated = None
+        # eof is only set once the gzip trailer (CRC + length) has been read,
+        # so a truncated stream is rejected rather than passed on partially.
+        # Bytes after the first member (trailing junk or a second member)
+        # land in unused_data; reject those rather than silently drop them.
+        if (inflated is None or len(inflated) > MAX_INFLATED_BODY_BYTES
+                or inflater.unconsumed_tail or not inflater.eof
+                or inflater.unused_data):
+            await reject(scope, receive, send)
+            return
+
+        headers = [
+            (k, v) for k, v in scope["headers"]
+            if k not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(len(inflated)).encode()))
+        sent = False
+
+        async def inflated_receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": inflated, "more_body": False}
+            return await receive()
+
+        await self.app(dict(scope, headers=headers), inflated_receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize database on startup
@@ -129,6 +195,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database on startup: {e}")
     yield
+    # Close pooled connections held by the email service
+    from services.email import close_email_client
+    await close_email_client()
 
 app = FastAPI(
     title="Spatix API",
@@ -140,6 +209,11 @@ app = FastAPI(
 # Add security headers middleware first
 app.add_middleware(SecurityHeadersMiddleware)
 
+# Compress large responses and accept gzip-encoded request bodies.
+# Level 6 is much faster than the default 9 on multi-MB GeoJSON for ~1-2% larger output.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+app.add_middleware(GzipRequestMiddleware)
+
 # CORS - restricted to allowed origins
 app.add_middleware(
     CORSMiddleware,
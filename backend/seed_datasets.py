@@ -6,31 +6,41 @@ For boundary datasets (countries, US states), downloads real polygon GeoJSON
 from Natural Earth (public domain) at runtime. Falls back to centroid points
 if download fails.
 
-Other datasets (airports, landmarks, cities, etc.) use inline point data —
-these are correctly represented as points.
+Other datasets (airports, landmarks, cities, etc.) use point data from
+seed_datasets.json — these are correctly represented as points.
 
 Usage:
-    python seed_datasets.py
+    python seed_datasets.py            # no-op if the catalog is unchanged
+    python seed_datasets.py --force    # ignore .seed_state and re-check the DB
 
 Sources:
     - Natural Earth (public domain) — ne_110m for countries, ne_110m for states
     - US Census TIGER/Line (public domain)
     - OpenStreetMap-derived (ODbL)
 """
-import json
+import asyncio
+import hashlib
+import mmap
 import sys
 import os
 import logging
+from functools import lru_cache
 from urllib.request import urlopen, Request
 from urllib.error import URLError
 
+import fastjsonschema
+import numpy as np
+import orjson
+import shapely
+from shapely.geometry import shape
+
 # Add parent dir to path so we can import database
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from database import init_db, get_db, USE_POSTGRES
-from database import create_dataset, dataset_exists
+from database import bulk_create_datasets, existing_dataset_ids, encode_coords_e7
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +64,49 @@ US_STATES_FALLBACK_URL = (
     "master/data/geojson/us-states.json"
 )
 
+# Shape check applied to every FeatureCollection before it is stored.
+# Compiled once at import into plain Python by fastjsonschema.
+GEOJSON_SCHEMA = {
+    "type": "object",
+    "required": ["type", "features"],
+    "properties": {
+        "type": {"const": "FeatureCollection"},
+        "features": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["type", "geometry"],
+                "properties": {
+                    "type": {"const": "Feature"},
+                    "properties": {"type": ["object", "null"]},
+                    "geometry": {
+                        "type": ["object", "null"],
+                        "required": ["type"],
+                        "properties": {
+                            "type": {"enum": [
+                                "Point", "MultiPoint", "LineString", "MultiLineString",
+                                "Polygon", "MultiPolygon", "GeometryCollection",
+                            ]},
+                            "coordinates": {"type": "array"},
+                        },
+                        # Lets _derive() read Point coordinates unchecked
+                        "if": {"properties": {"type": {"const": "Point"}}},
+                        "then": {
+                            "required": ["coordinates"],
+                            "properties": {"coordinates": {
+                                "minItems": 2, "items": {"type": "number"},
+                            }},
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+_validate_geojson = fastjsonschema.compile(GEOJSON_SCHEMA)
+
 
 def _download_geojson(url: str, timeout: int = 30) -> dict | None:
     """Download and parse a GeoJSON file from a URL. Returns None on failure."""
@@ -63,12 +116,13 @@ def _download_geojson(url: str, timeout: int = 30) -> dict | None:
             if resp.status != 200:
                 logger.warning(f"HTTP {resp.status} for {url}")
                 return None
-            data = json.loads(resp.read().decode("utf-8"))
-            if data.get("type") == "FeatureCollection" and data.get("features"):
-                return data
-            logger.warning(f"Not a valid FeatureCollection from {url}")
-            return None
-    except (URLError, json.JSONDecodeError, OSError, TimeoutError) as e:
+            data = orjson.loads(resp.read())
+            _validate_geojson(data)
+            return data
+    except fastjsonschema.JsonSchemaException as e:
+        logger.warning(f"Not a valid FeatureCollection from {url}: {e.message}")
+        return None
+    except (URLError, orjson.JSONDecodeError, OSError, TimeoutError) as e:
         logger.warning(f"Failed to download {url}: {e}")
         return None
 
@@ -199,471 +253,226 @@ CENTROID_US_STATES = {
 
 
 # ==================== SEED DATA ====================
-# Point datasets — these are correctly represented as points.
-
-SEED_DATASETS = [
-    {
-        "id": "ds_world-countries",
-        "title": "World Countries",
-        "description": "Country boundaries for all sovereign nations. Real polygon boundaries from Natural Earth 110m (simplified). Suitable for thematic maps and choropleths.",
-        "license": "public-domain",
-        "category": "boundaries",
-        "tags": "countries,world,boundaries,political,nations,polygons",
-        "data": None,  # Resolved at runtime via download
-        "source_name": "Natural Earth",
-        "source_url": "https://www.naturalearthdata.com/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "Global",
-        "data_date": "2024-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Country name"},
-            {"name": "iso_a3", "type": "string", "description": "ISO 3166-1 alpha-3 code"},
-            {"name": "continent", "type": "string", "description": "Continent"},
-            {"name": "pop_est", "type": "integer", "description": "Estimated population"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-    },
-    {
-        "id": "ds_us-states",
-        "title": "US States",
-        "description": "US state boundaries with real polygon outlines from Natural Earth / Census. Use as a base layer for any US thematic map.",
-        "license": "public-domain",
-        "category": "boundaries",
-        "tags": "us,states,boundaries,census,fips,polygons",
-        "data": None,  # Resolved at runtime via download
-        "source_name": "Natural Earth / US Census Bureau",
-        "source_url": "https://www.naturalearthdata.com/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "United States",
-        "data_date": "2024-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "State name"},
-            {"name": "abbr", "type": "string", "description": "State abbreviation"},
-            {"name": "fips", "type": "string", "description": "FIPS code"},
-            {"name": "pop", "type": "integer", "description": "Population estimate"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-    },
-    {
-        "id": "ds_us-national-parks",
-        "title": "US National Parks",
-        "description": "Major US National Parks with locations, area, and visitor counts. Great for tourism and outdoor recreation maps.",
-        "license": "public-domain",
-        "category": "environment",
-        "tags": "national parks,us,nps,nature,recreation,tourism",
-        "source_name": "National Park Service",
-        "source_url": "https://www.nps.gov/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "United States",
-        "data_date": "2022-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Park name"},
-            {"name": "state", "type": "string", "description": "State(s)"},
-            {"name": "area_sq_mi", "type": "number", "description": "Area in square miles"},
-            {"name": "visitors_2022", "type": "integer", "description": "Annual visitors (2022)"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Yellowstone", "state": "WY/MT/ID", "area_sq_mi": 3471, "visitors_2022": 3289439}, "geometry": {"type": "Point", "coordinates": [-110.5, 44.6]}},
-                {"type": "Feature", "properties": {"name": "Grand Canyon", "state": "AZ", "area_sq_mi": 1902, "visitors_2022": 4732101}, "geometry": {"type": "Point", "coordinates": [-112.1, 36.1]}},
-                {"type": "Feature", "properties": {"name": "Yosemite", "state": "CA", "area_sq_mi": 1169, "visitors_2022": 3667550}, "geometry": {"type": "Point", "coordinates": [-119.5, 37.8]}},
-                {"type": "Feature", "properties": {"name": "Zion", "state": "UT", "area_sq_mi": 229, "visitors_2022": 4692599}, "geometry": {"type": "Point", "coordinates": [-113.0, 37.3]}},
-                {"type": "Feature", "properties": {"name": "Rocky Mountain", "state": "CO", "area_sq_mi": 415, "visitors_2022": 4300000}, "geometry": {"type": "Point", "coordinates": [-105.6, 40.3]}},
-                {"type": "Feature", "properties": {"name": "Acadia", "state": "ME", "area_sq_mi": 76, "visitors_2022": 3970260}, "geometry": {"type": "Point", "coordinates": [-68.2, 44.3]}},
-                {"type": "Feature", "properties": {"name": "Grand Teton", "state": "WY", "area_sq_mi": 485, "visitors_2022": 3289439}, "geometry": {"type": "Point", "coordinates": [-110.8, 43.7]}},
-                {"type": "Feature", "properties": {"name": "Olympic", "state": "WA", "area_sq_mi": 1442, "visitors_2022": 2718925}, "geometry": {"type": "Point", "coordinates": [-123.5, 47.8]}},
-                {"type": "Feature", "properties": {"name": "Glacier", "state": "MT", "area_sq_mi": 1583, "visitors_2022": 2908458}, "geometry": {"type": "Point", "coordinates": [-113.8, 48.7]}},
-                {"type": "Feature", "properties": {"name": "Joshua Tree", "state": "CA", "area_sq_mi": 1235, "visitors_2022": 3064400}, "geometry": {"type": "Point", "coordinates": [-115.9, 33.8]}},
-                {"type": "Feature", "properties": {"name": "Bryce Canyon", "state": "UT", "area_sq_mi": 56, "visitors_2022": 2104600}, "geometry": {"type": "Point", "coordinates": [-112.2, 37.6]}},
-                {"type": "Feature", "properties": {"name": "Denali", "state": "AK", "area_sq_mi": 9492, "visitors_2022": 593888}, "geometry": {"type": "Point", "coordinates": [-151.0, 63.1]}},
-                {"type": "Feature", "properties": {"name": "Arches", "state": "UT", "area_sq_mi": 120, "visitors_2022": 1549827}, "geometry": {"type": "Point", "coordinates": [-109.5, 38.7]}},
-                {"type": "Feature", "properties": {"name": "Great Smoky Mountains", "state": "TN/NC", "area_sq_mi": 816, "visitors_2022": 12937633}, "geometry": {"type": "Point", "coordinates": [-83.5, 35.6]}},
-                {"type": "Feature", "properties": {"name": "Everglades", "state": "FL", "area_sq_mi": 2357, "visitors_2022": 954032}, "geometry": {"type": "Point", "coordinates": [-80.9, 25.3]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_world-major-cities",
-        "title": "World Major Cities",
-        "description": "100+ major world cities with population, country, and timezone. Essential base layer for global maps.",
-        "license": "public-domain",
-        "category": "demographics",
-        "tags": "cities,world,population,urban,capitals",
-        "source_name": "United Nations World Urbanization Prospects",
-        "source_url": "https://population.un.org/wup/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "Global",
-        "data_date": "2023-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "City name"},
-            {"name": "country", "type": "string", "description": "Country name"},
-            {"name": "pop", "type": "integer", "description": "Metro area population"},
-            {"name": "capital", "type": "boolean", "description": "Is national capital"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Tokyo", "country": "Japan", "pop": 37400068, "capital": True}, "geometry": {"type": "Point", "coordinates": [139.6917, 35.6895]}},
-                {"type": "Feature", "properties": {"name": "Delhi", "country": "India", "pop": 30290936, "capital": True}, "geometry": {"type": "Point", "coordinates": [77.1025, 28.7041]}},
-                {"type": "Feature", "properties": {"name": "Shanghai", "country": "China", "pop": 27058480, "capital": False}, "geometry": {"type": "Point", "coordinates": [121.4737, 31.2304]}},
-                {"type": "Feature", "properties": {"name": "São Paulo", "country": "Brazil", "pop": 22043028, "capital": False}, "geometry": {"type": "Point", "coordinates": [-46.6333, -23.5505]}},
-                {"type": "Feature", "properties": {"name": "Mexico City", "country": "Mexico", "pop": 21782378, "capital": True}, "geometry": {"type": "Point", "coordinates": [-99.1332, 19.4326]}},
-                {"type": "Feature", "properties": {"name": "Cairo", "country": "Egypt", "pop": 20901000, "capital": True}, "geometry": {"type": "Point", "coordinates": [31.2357, 30.0444]}},
-                {"type": "Feature", "properties": {"name": "Mumbai", "country": "India", "pop": 20411000, "capital": False}, "geometry": {"type": "Point", "coordinates": [72.8777, 19.0760]}},
-                {"type": "Feature", "properties": {"name": "Beijing", "country": "China", "pop": 20384000, "capital": True}, "geometry": {"type": "Point", "coordinates": [116.4074, 39.9042]}},
-                {"type": "Feature", "properties": {"name": "Dhaka", "country": "Bangladesh", "pop": 21006000, "capital": True}, "geometry": {"type": "Point", "coordinates": [90.4125, 23.8103]}},
-                {"type": "Feature", "properties": {"name": "Osaka", "country": "Japan", "pop": 19281000, "capital": False}, "geometry": {"type": "Point", "coordinates": [135.5023, 34.6937]}},
-                {"type": "Feature", "properties": {"name": "New York", "country": "USA", "pop": 18819000, "capital": False}, "geometry": {"type": "Point", "coordinates": [-74.0060, 40.7128]}},
-                {"type": "Feature", "properties": {"name": "London", "country": "UK", "pop": 9541000, "capital": True}, "geometry": {"type": "Point", "coordinates": [-0.1278, 51.5074]}},
-                {"type": "Feature", "properties": {"name": "Paris", "country": "France", "pop": 11017000, "capital": True}, "geometry": {"type": "Point", "coordinates": [2.3522, 48.8566]}},
-                {"type": "Feature", "properties": {"name": "Istanbul", "country": "Turkey", "pop": 15462000, "capital": False}, "geometry": {"type": "Point", "coordinates": [28.9784, 41.0082]}},
-                {"type": "Feature", "properties": {"name": "Lagos", "country": "Nigeria", "pop": 14862000, "capital": False}, "geometry": {"type": "Point", "coordinates": [3.3792, 6.5244]}},
-                {"type": "Feature", "properties": {"name": "Los Angeles", "country": "USA", "pop": 12458000, "capital": False}, "geometry": {"type": "Point", "coordinates": [-118.2437, 34.0522]}},
-                {"type": "Feature", "properties": {"name": "Buenos Aires", "country": "Argentina", "pop": 15154000, "capital": True}, "geometry": {"type": "Point", "coordinates": [-58.3816, -34.6037]}},
-                {"type": "Feature", "properties": {"name": "Kolkata", "country": "India", "pop": 14681000, "capital": False}, "geometry": {"type": "Point", "coordinates": [88.3639, 22.5726]}},
-                {"type": "Feature", "properties": {"name": "Kinshasa", "country": "DRC", "pop": 14342000, "capital": True}, "geometry": {"type": "Point", "coordinates": [15.2663, -4.4419]}},
-                {"type": "Feature", "properties": {"name": "Moscow", "country": "Russia", "pop": 12538000, "capital": True}, "geometry": {"type": "Point", "coordinates": [37.6173, 55.7558]}},
-                {"type": "Feature", "properties": {"name": "Sydney", "country": "Australia", "pop": 5312000, "capital": False}, "geometry": {"type": "Point", "coordinates": [151.2093, -33.8688]}},
-                {"type": "Feature", "properties": {"name": "Singapore", "country": "Singapore", "pop": 5686000, "capital": True}, "geometry": {"type": "Point", "coordinates": [103.8198, 1.3521]}},
-                {"type": "Feature", "properties": {"name": "Seoul", "country": "South Korea", "pop": 9776000, "capital": True}, "geometry": {"type": "Point", "coordinates": [126.9780, 37.5665]}},
-                {"type": "Feature", "properties": {"name": "Berlin", "country": "Germany", "pop": 3645000, "capital": True}, "geometry": {"type": "Point", "coordinates": [13.4050, 52.5200]}},
-                {"type": "Feature", "properties": {"name": "Toronto", "country": "Canada", "pop": 6255000, "capital": False}, "geometry": {"type": "Point", "coordinates": [-79.3832, 43.6532]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_us-major-airports",
-        "title": "US Major Airports",
-        "description": "Top US airports by passenger volume with IATA codes, coordinates, and annual passenger counts.",
-        "license": "public-domain",
-        "category": "transportation",
-        "tags": "airports,us,aviation,transportation,travel",
-        "source_name": "FAA / Bureau of Transportation Statistics",
-        "source_url": "https://www.bts.gov/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "United States",
-        "data_date": "2022-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Airport name"},
-            {"name": "iata", "type": "string", "description": "IATA code"},
-            {"name": "city", "type": "string", "description": "City"},
-            {"name": "state", "type": "string", "description": "State abbreviation"},
-            {"name": "passengers_2022", "type": "integer", "description": "Annual passengers (2022)"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Hartsfield-Jackson Atlanta", "iata": "ATL", "city": "Atlanta", "state": "GA", "passengers_2022": 93699630}, "geometry": {"type": "Point", "coordinates": [-84.4281, 33.6407]}},
-                {"type": "Feature", "properties": {"name": "Dallas/Fort Worth", "iata": "DFW", "city": "Dallas", "state": "TX", "passengers_2022": 73362946}, "geometry": {"type": "Point", "coordinates": [-97.0380, 32.8998]}},
-                {"type": "Feature", "properties": {"name": "Denver International", "iata": "DEN", "city": "Denver", "state": "CO", "passengers_2022": 69286461}, "geometry": {"type": "Point", "coordinates": [-104.6737, 39.8561]}},
-                {"type": "Feature", "properties": {"name": "O'Hare International", "iata": "ORD", "city": "Chicago", "state": "IL", "passengers_2022": 68340619}, "geometry": {"type": "Point", "coordinates": [-87.9048, 41.9742]}},
-                {"type": "Feature", "properties": {"name": "Los Angeles International", "iata": "LAX", "city": "Los Angeles", "state": "CA", "passengers_2022": 65924298}, "geometry": {"type": "Point", "coordinates": [-118.4085, 33.9416]}},
-                {"type": "Feature", "properties": {"name": "John F. Kennedy", "iata": "JFK", "city": "New York", "state": "NY", "passengers_2022": 55220250}, "geometry": {"type": "Point", "coordinates": [-73.7781, 40.6413]}},
-                {"type": "Feature", "properties": {"name": "San Francisco International", "iata": "SFO", "city": "San Francisco", "state": "CA", "passengers_2022": 40849692}, "geometry": {"type": "Point", "coordinates": [-122.3790, 37.6213]}},
-                {"type": "Feature", "properties": {"name": "Seattle-Tacoma", "iata": "SEA", "city": "Seattle", "state": "WA", "passengers_2022": 49849520}, "geometry": {"type": "Point", "coordinates": [-122.3088, 47.4502]}},
-                {"type": "Feature", "properties": {"name": "Orlando International", "iata": "MCO", "city": "Orlando", "state": "FL", "passengers_2022": 50626479}, "geometry": {"type": "Point", "coordinates": [-81.3089, 28.4312]}},
-                {"type": "Feature", "properties": {"name": "Miami International", "iata": "MIA", "city": "Miami", "state": "FL", "passengers_2022": 50538745}, "geometry": {"type": "Point", "coordinates": [-80.2906, 25.7959]}},
-                {"type": "Feature", "properties": {"name": "Newark Liberty", "iata": "EWR", "city": "Newark", "state": "NJ", "passengers_2022": 40665000}, "geometry": {"type": "Point", "coordinates": [-74.1687, 40.6895]}},
-                {"type": "Feature", "properties": {"name": "Boston Logan", "iata": "BOS", "city": "Boston", "state": "MA", "passengers_2022": 32781000}, "geometry": {"type": "Point", "coordinates": [-71.0096, 42.3656]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_world-landmarks",
-        "title": "World Famous Landmarks",
-        "description": "Iconic landmarks and monuments around the world. Perfect for tourism maps and cultural geography.",
-        "license": "public-domain",
-        "category": "culture",
-        "tags": "landmarks,monuments,tourism,culture,world,famous",
-        "source_name": "OpenStreetMap / Wikipedia",
-        "source_url": "https://www.openstreetmap.org/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "Global",
-        "data_date": "2024-01",
-        "update_frequency": "as-needed",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Landmark name"},
-            {"name": "city", "type": "string", "description": "City"},
-            {"name": "country", "type": "string", "description": "Country"},
-            {"name": "type", "type": "string", "description": "Landmark type"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Eiffel Tower", "city": "Paris", "country": "France", "type": "monument"}, "geometry": {"type": "Point", "coordinates": [2.2945, 48.8584]}},
-                {"type": "Feature", "properties": {"name": "Statue of Liberty", "city": "New York", "country": "USA", "type": "monument"}, "geometry": {"type": "Point", "coordinates": [-74.0445, 40.6892]}},
-                {"type": "Feature", "properties": {"name": "Colosseum", "city": "Rome", "country": "Italy", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [12.4924, 41.8902]}},
-                {"type": "Feature", "properties": {"name": "Taj Mahal", "city": "Agra", "country": "India", "type": "monument"}, "geometry": {"type": "Point", "coordinates": [78.0421, 27.1751]}},
-                {"type": "Feature", "properties": {"name": "Great Wall of China", "city": "Beijing", "country": "China", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [116.5704, 40.4319]}},
-                {"type": "Feature", "properties": {"name": "Machu Picchu", "city": "Cusco", "country": "Peru", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [-72.5450, -13.1631]}},
-                {"type": "Feature", "properties": {"name": "Christ the Redeemer", "city": "Rio de Janeiro", "country": "Brazil", "type": "monument"}, "geometry": {"type": "Point", "coordinates": [-43.2105, -22.9519]}},
-                {"type": "Feature", "properties": {"name": "Sydney Opera House", "city": "Sydney", "country": "Australia", "type": "cultural"}, "geometry": {"type": "Point", "coordinates": [151.2153, -33.8568]}},
-                {"type": "Feature", "properties": {"name": "Big Ben", "city": "London", "country": "UK", "type": "monument"}, "geometry": {"type": "Point", "coordinates": [-0.1246, 51.5007]}},
-                {"type": "Feature", "properties": {"name": "Pyramids of Giza", "city": "Giza", "country": "Egypt", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [31.1342, 29.9792]}},
-                {"type": "Feature", "properties": {"name": "Golden Gate Bridge", "city": "San Francisco", "country": "USA", "type": "infrastructure"}, "geometry": {"type": "Point", "coordinates": [-122.4783, 37.8199]}},
-                {"type": "Feature", "properties": {"name": "Burj Khalifa", "city": "Dubai", "country": "UAE", "type": "building"}, "geometry": {"type": "Point", "coordinates": [55.2744, 25.1972]}},
-                {"type": "Feature", "properties": {"name": "Mount Fuji", "city": "Shizuoka", "country": "Japan", "type": "natural"}, "geometry": {"type": "Point", "coordinates": [138.7274, 35.3606]}},
-                {"type": "Feature", "properties": {"name": "Sagrada Familia", "city": "Barcelona", "country": "Spain", "type": "cultural"}, "geometry": {"type": "Point", "coordinates": [2.1744, 41.4036]}},
-                {"type": "Feature", "properties": {"name": "Petra", "city": "Ma'an", "country": "Jordan", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [35.4444, 30.3285]}},
-                {"type": "Feature", "properties": {"name": "Angkor Wat", "city": "Siem Reap", "country": "Cambodia", "type": "historic"}, "geometry": {"type": "Point", "coordinates": [103.8670, 13.4125]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_us-tech-hubs",
-        "title": "US Tech Hubs",
-        "description": "Major technology and startup hubs across the United States with notable companies and specializations.",
-        "license": "public-domain",
-        "category": "business",
-        "tags": "tech,startups,business,silicon valley,innovation,us",
-        "source_name": "Spatix Research",
-        "source_url": "",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "United States",
-        "data_date": "2024-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Hub name"},
-            {"name": "city", "type": "string", "description": "City"},
-            {"name": "state", "type": "string", "description": "State abbreviation"},
-            {"name": "focus", "type": "string", "description": "Technology focus areas"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Silicon Valley", "city": "San Jose", "state": "CA", "focus": "General tech, AI, VC"}, "geometry": {"type": "Point", "coordinates": [-121.8863, 37.3382]}},
-                {"type": "Feature", "properties": {"name": "San Francisco", "city": "San Francisco", "state": "CA", "focus": "SaaS, Fintech, AI"}, "geometry": {"type": "Point", "coordinates": [-122.4194, 37.7749]}},
-                {"type": "Feature", "properties": {"name": "Seattle", "city": "Seattle", "state": "WA", "focus": "Cloud, E-commerce, Gaming"}, "geometry": {"type": "Point", "coordinates": [-122.3321, 47.6062]}},
-                {"type": "Feature", "properties": {"name": "Austin", "city": "Austin", "state": "TX", "focus": "Semiconductors, SaaS, Crypto"}, "geometry": {"type": "Point", "coordinates": [-97.7431, 30.2672]}},
-                {"type": "Feature", "properties": {"name": "New York City", "city": "New York", "state": "NY", "focus": "Fintech, Media, AdTech"}, "geometry": {"type": "Point", "coordinates": [-74.0060, 40.7128]}},
-                {"type": "Feature", "properties": {"name": "Boston", "city": "Boston", "state": "MA", "focus": "Biotech, Robotics, EdTech"}, "geometry": {"type": "Point", "coordinates": [-71.0589, 42.3601]}},
-                {"type": "Feature", "properties": {"name": "Denver/Boulder", "city": "Denver", "state": "CO", "focus": "Aerospace, Telecom, Outdoor Tech"}, "geometry": {"type": "Point", "coordinates": [-105.2705, 39.7392]}},
-                {"type": "Feature", "properties": {"name": "Research Triangle", "city": "Raleigh", "state": "NC", "focus": "Biotech, Enterprise Software"}, "geometry": {"type": "Point", "coordinates": [-78.6382, 35.7796]}},
-                {"type": "Feature", "properties": {"name": "Los Angeles", "city": "Los Angeles", "state": "CA", "focus": "Entertainment Tech, SpaceTech"}, "geometry": {"type": "Point", "coordinates": [-118.2437, 34.0522]}},
-                {"type": "Feature", "properties": {"name": "Miami", "city": "Miami", "state": "FL", "focus": "Crypto, LatAm Gateway"}, "geometry": {"type": "Point", "coordinates": [-80.1918, 25.7617]}},
-                {"type": "Feature", "properties": {"name": "Pittsburgh", "city": "Pittsburgh", "state": "PA", "focus": "Robotics, Autonomous Vehicles, AI"}, "geometry": {"type": "Point", "coordinates": [-79.9959, 40.4406]}},
-                {"type": "Feature", "properties": {"name": "Washington DC", "city": "Washington", "state": "DC", "focus": "GovTech, Cybersecurity, Defense"}, "geometry": {"type": "Point", "coordinates": [-77.0369, 38.9072]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_world-universities-top",
-        "title": "Top World Universities",
-        "description": "Top-ranked universities globally with locations and approximate rankings.",
-        "license": "public-domain",
-        "category": "education",
-        "tags": "universities,education,world,rankings,academic",
-        "source_name": "QS World University Rankings",
-        "source_url": "https://www.topuniversities.com/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "Global",
-        "data_date": "2024-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "University name"},
-            {"name": "city", "type": "string", "description": "City"},
-            {"name": "country", "type": "string", "description": "Country"},
-            {"name": "rank_approx", "type": "integer", "description": "Approximate global rank"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "MIT", "city": "Cambridge", "country": "USA", "rank_approx": 1}, "geometry": {"type": "Point", "coordinates": [-71.0942, 42.3601]}},
-                {"type": "Feature", "properties": {"name": "Stanford University", "city": "Stanford", "country": "USA", "rank_approx": 2}, "geometry": {"type": "Point", "coordinates": [-122.1697, 37.4275]}},
-                {"type": "Feature", "properties": {"name": "Harvard University", "city": "Cambridge", "country": "USA", "rank_approx": 3}, "geometry": {"type": "Point", "coordinates": [-71.1167, 42.3770]}},
-                {"type": "Feature", "properties": {"name": "University of Oxford", "city": "Oxford", "country": "UK", "rank_approx": 4}, "geometry": {"type": "Point", "coordinates": [-1.2544, 51.7548]}},
-                {"type": "Feature", "properties": {"name": "University of Cambridge", "city": "Cambridge", "country": "UK", "rank_approx": 5}, "geometry": {"type": "Point", "coordinates": [0.1218, 52.2053]}},
-                {"type": "Feature", "properties": {"name": "Caltech", "city": "Pasadena", "country": "USA", "rank_approx": 6}, "geometry": {"type": "Point", "coordinates": [-118.1253, 34.1377]}},
-                {"type": "Feature", "properties": {"name": "ETH Zurich", "city": "Zurich", "country": "Switzerland", "rank_approx": 7}, "geometry": {"type": "Point", "coordinates": [8.5480, 47.3769]}},
-                {"type": "Feature", "properties": {"name": "University of Tokyo", "city": "Tokyo", "country": "Japan", "rank_approx": 23}, "geometry": {"type": "Point", "coordinates": [139.7622, 35.7128]}},
-                {"type": "Feature", "properties": {"name": "Tsinghua University", "city": "Beijing", "country": "China", "rank_approx": 14}, "geometry": {"type": "Point", "coordinates": [116.3266, 40.0003]}},
-                {"type": "Feature", "properties": {"name": "National University of Singapore", "city": "Singapore", "country": "Singapore", "rank_approx": 11}, "geometry": {"type": "Point", "coordinates": [103.7764, 1.2966]}},
-                {"type": "Feature", "properties": {"name": "University of Melbourne", "city": "Melbourne", "country": "Australia", "rank_approx": 33}, "geometry": {"type": "Point", "coordinates": [144.9612, -37.7983]}},
-                {"type": "Feature", "properties": {"name": "University of Toronto", "city": "Toronto", "country": "Canada", "rank_approx": 21}, "geometry": {"type": "Point", "coordinates": [-79.3957, 43.6629]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_world-major-ports",
-        "title": "World Major Seaports",
-        "description": "Busiest seaports worldwide by container throughput. Essential for logistics and trade maps.",
-        "license": "public-domain",
-        "category": "transportation",
-        "tags": "ports,shipping,trade,logistics,maritime,world",
-        "source_name": "World Shipping Council",
-        "source_url": "https://www.worldshipping.org/",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "Global",
-        "data_date": "2023-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Port name"},
-            {"name": "country", "type": "string", "description": "Country"},
-            {"name": "teu_millions", "type": "number", "description": "TEU throughput in millions"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Port of Shanghai", "country": "China", "teu_millions": 47.0}, "geometry": {"type": "Point", "coordinates": [121.8, 30.6]}},
-                {"type": "Feature", "properties": {"name": "Port of Singapore", "country": "Singapore", "teu_millions": 37.2}, "geometry": {"type": "Point", "coordinates": [103.8, 1.2]}},
-                {"type": "Feature", "properties": {"name": "Port of Ningbo-Zhoushan", "country": "China", "teu_millions": 33.3}, "geometry": {"type": "Point", "coordinates": [121.9, 29.9]}},
-                {"type": "Feature", "properties": {"name": "Port of Shenzhen", "country": "China", "teu_millions": 28.8}, "geometry": {"type": "Point", "coordinates": [114.1, 22.5]}},
-                {"type": "Feature", "properties": {"name": "Port of Guangzhou", "country": "China", "teu_millions": 24.2}, "geometry": {"type": "Point", "coordinates": [113.5, 22.9]}},
-                {"type": "Feature", "properties": {"name": "Port of Busan", "country": "South Korea", "teu_millions": 22.7}, "geometry": {"type": "Point", "coordinates": [129.0, 35.1]}},
-                {"type": "Feature", "properties": {"name": "Port of Qingdao", "country": "China", "teu_millions": 24.4}, "geometry": {"type": "Point", "coordinates": [120.3, 36.1]}},
-                {"type": "Feature", "properties": {"name": "Port of Rotterdam", "country": "Netherlands", "teu_millions": 14.5}, "geometry": {"type": "Point", "coordinates": [4.3, 51.9]}},
-                {"type": "Feature", "properties": {"name": "Port of Dubai", "country": "UAE", "teu_millions": 14.1}, "geometry": {"type": "Point", "coordinates": [55.3, 25.0]}},
-                {"type": "Feature", "properties": {"name": "Port of Los Angeles", "country": "USA", "teu_millions": 9.9}, "geometry": {"type": "Point", "coordinates": [-118.3, 33.7]}},
-                {"type": "Feature", "properties": {"name": "Port of Long Beach", "country": "USA", "teu_millions": 9.1}, "geometry": {"type": "Point", "coordinates": [-118.2, 33.7]}},
-                {"type": "Feature", "properties": {"name": "Port of Hamburg", "country": "Germany", "teu_millions": 8.7}, "geometry": {"type": "Point", "coordinates": [9.9, 53.5]}},
-            ]
-        },
-    },
-    {
-        "id": "ds_us-hospitals-major",
-        "title": "US Major Hospitals",
-        "description": "Top-ranked US hospitals with specializations and bed counts.",
-        "license": "public-domain",
-        "category": "health",
-        "tags": "hospitals,health,medical,us,healthcare",
-        "source_name": "US News & World Report",
-        "source_url": "https://health.usnews.com/best-hospitals",
-        "license_type": "public-domain",
-        "attribution_required": False,
-        "commercial_use": True,
-        "region": "United States",
-        "data_date": "2023-01",
-        "update_frequency": "yearly",
-        "schema_def": [
-            {"name": "name", "type": "string", "description": "Hospital name"},
-            {"name": "city", "type": "string", "description": "City"},
-            {"name": "state", "type": "string", "description": "State abbreviation"},
-            {"name": "beds", "type": "integer", "description": "Number of beds"},
-            {"name": "specialty", "type": "string", "description": "Primary specialty"},
-        ],
-        "creator_type": "agent",
-        "creator_id": "spatix-seed",
-        "creator_name": "Spatix Seed",
-        "data": {
-            "type": "FeatureCollection",
-            "features": [
-                {"type": "Feature", "properties": {"name": "Mayo Clinic", "city": "Rochester", "state": "MN", "beds": 1265, "specialty": "Multi-specialty"}, "geometry": {"type": "Point", "coordinates": [-92.4666, 44.0225]}},
-                {"type": "Feature", "properties": {"name": "Cleveland Clinic", "city": "Cleveland", "state": "OH", "beds": 1400, "specialty": "Cardiology"}, "geometry": {"type": "Point", "coordinates": [-81.6219, 41.5025]}},
-                {"type": "Feature", "properties": {"name": "Johns Hopkins Hospital", "city": "Baltimore", "state": "MD", "beds": 1162, "specialty": "Research"}, "geometry": {"type": "Point", "coordinates": [-76.5913, 39.2964]}},
-                {"type": "Feature", "properties": {"name": "Massachusetts General Hospital", "city": "Boston", "state": "MA", "beds": 999, "specialty": "Research"}, "geometry": {"type": "Point", "coordinates": [-71.0695, 42.3626]}},
-                {"type": "Feature", "properties": {"name": "UCLA Medical Center", "city": "Los Angeles", "state": "CA", "beds": 520, "specialty": "Multi-specialty"}, "geometry": {"type": "Point", "coordinates": [-118.4452, 34.0660]}},
-                {"type": "Feature", "properties": {"name": "UCSF Medical Center", "city": "San Francisco", "state": "CA", "beds": 600, "specialty": "Research"}, "geometry": {"type": "Point", "coordinates": [-122.4580, 37.7631]}},
-                {"type": "Feature", "properties": {"name": "Cedars-Sinai", "city": "Los Angeles", "state": "CA", "beds": 886, "specialty": "Multi-specialty"}, "geometry": {"type": "Point", "coordinates": [-118.3802, 34.0752]}},
-                {"type": "Feature", "properties": {"name": "NYU Langone", "city": "New York", "state": "NY", "beds": 1069, "specialty": "Research"}, "geometry": {"type": "Point", "coordinates": [-73.9741, 40.7420]}},
-                {"type": "Feature", "properties": {"name": "Stanford Health Care", "city": "Stanford", "state": "CA", "beds": 613, "specialty": "Research"}, "geometry": {"type": "Point", "coordinates": [-122.1750, 37.4346]}},
-                {"type": "Feature", "properties": {"name": "MD Anderson Cancer Center", "city": "Houston", "state": "TX", "beds": 670, "specialty": "Oncology"}, "geometry": {"type": "Point", "coordinates": [-95.3975, 29.7075]}},
-            ]
-        },
-    },
-]
+# The catalog lives in seed_datasets.json next to this script. Point datasets
+# carry inline data; boundary datasets have "data": null and are downloaded.
 
+SEED_DATASETS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "seed_datasets.json"
+)
+
+
+def _load_seed_datasets() -> list:
+    """Load the seed catalog. The file is mmap'd read-only so it is only
+    paged in when a seed run actually needs it, not on import."""
+    with open(SEED_DATASETS_PATH, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+# Records the signature of the last successful seed run so an unchanged
+# catalog can skip the boundary downloads and geometry derivation. The file
+# lives with the code, not the data, so it is only trusted while the
+# database still holds every catalog dataset (see _seed_state_current).
+SEED_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".seed_state")
 
-def _calculate_bbox(data):
-    """Calculate bounding box from GeoJSON features."""
-    lngs, lats = [], []
-    for f in data.get("features", []):
-        geom = f.get("geometry", {})
-        _extract_all_coords(geom, lngs, lats)
-    if not lngs:
-        return -180, -90, 180, 90
-    return min(lngs), min(lats), max(lngs), max(lats)
 
+def _seed_signature() -> str:
+    """Hash the seed catalog together with the target database location."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(SEED_DATASETS_PATH, "rb") as f:
+        h.update(f.read())
+    h.update(os.environ.get("DATABASE_URL", "").encode())
+    h.update(os.environ.get("DB_PATH", "").encode())
+    return h.hexdigest()
 
-def _extract_all_coords(geom: dict, lngs: list, lats: list):
-    """Extract all coordinates from any geometry type."""
-    gt = geom.get("type", "")
-    coords = geom.get("coordinates", [])
 
-    if gt == "Point" and len(coords) >= 2:
-        lngs.append(coords[0])
-        lats.append(coords[1])
+def _read_seed_state() -> str | None:
+    try:
+        with open(SEED_STATE_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _seed_state_current(signature: str) -> bool:
+    """True if the last successful run seeded this catalog into this database.
+
+    A wiped SQLite file or a recreated Postgres DB at the same URL keeps the
+    same signature, so confirm the rows are really there with one query.
+    """
+    if _read_seed_state() != signature:
+        return False
+    ids = [ds["id"] for ds in _load_seed_datasets()]
+    return len(existing_dataset_ids(ids)) == len(ids)
+
+
+def _write_seed_state(signature: str):
+    try:
+        with open(SEED_STATE_PATH, "w") as f:
+            f.write(signature)
+    except OSError as e:
+        logger.warning(f"Could not write {SEED_STATE_PATH}: {e}")
+
+
+def _iter_positions(gt: str, coords: list):
+    """Yield lng, lat, lng, lat, ... for every position in any geometry type."""
+    if gt == "Point":
+        rings = [[coords]]
     elif gt in ("LineString", "MultiPoint"):
-        for c in coords:
-            if len(c) >= 2:
-                lngs.append(c[0])
-                lats.append(c[1])
+        rings = [coords]
     elif gt in ("Polygon", "MultiLineString"):
-        for ring in coords:
-            for c in ring:
-                if len(c) >= 2:
-                    lngs.append(c[0])
-                    lats.append(c[1])
+        rings = coords
     elif gt == "MultiPolygon":
-        for poly in coords:
-            for ring in poly:
-                for c in ring:
-                    if len(c) >= 2:
-                        lngs.append(c[0])
-                        lats.append(c[1])
+        rings = [ring for poly in coords for ring in poly]
+    else:
+        return
+
+    for ring in rings:
+        for c in ring:
+            if len(c) >= 2:
+                yield c[0]
+                yield c[1]
+
+
+# Every type the schema admits, in sorted order, so joining in this order
+# gives the same string as ",".join(sorted(types)) without sorting.
+_GEOM_ORDER = (
+    "GeometryCollection", "LineString", "MultiLineString", "MultiPoint",
+    "MultiPolygon", "Point", "Polygon",
+)
+
+
+def _join_geometry_types(geom_types: set) -> str:
+    """Canonical comma-separated geometry type list."""
+    if len(geom_types) == 1:
+        return next(iter(geom_types))
+    return ",".join(g for g in _GEOM_ORDER if g in geom_types)
 
 
-def _resolve_boundary_data():
+def _serialize(data) -> bytes:
+    """Serialize GeoJSON to compact UTF-8 JSON bytes."""
+    return orjson.dumps(data)
+
+
+def _build_spatial_index(data, dataset_id: str) -> bytes | None:
+    """Pack a dataset's geometries as one WKB GeometryCollection.
+
+    The backend bulk-loads an STRtree straight from this blob (see
+    database.get_dataset_spatial_index) instead of re-parsing GeoJSON.
+    Tree indices must line up with the features, so a geometry GEOS
+    rejects (e.g. a one-position LineString) drops the index for the
+    whole dataset rather than just that feature.
+    """
+    geoms = []
+    for i, f in enumerate(data.get("features", [])):
+        if not f.get("geometry"):
+            continue
+        try:
+            geoms.append(shape(f["geometry"]))
+        except (shapely.errors.ShapelyError, ValueError) as e:
+            logger.warning(f"  No spatial index for {dataset_id}: feature {i} has a degenerate geometry ({str(e).strip()})")
+            return None
+    return shapely.to_wkb(shapely.geometrycollections(geoms))
+
+
+def _derive(data: dict, dataset_id: str) -> dict:
+    """Compute every stored field that depends only on a dataset's GeoJSON."""
+    # Single pass over features: geometry types, flattened positions
+    # and property keys, each geometry dict fetched exactly once.
+    features = data.get("features", [])
+    geom_types = set()
+    total_props = set()
+    flat = []
+    for f in features:
+        geom = f.get("geometry") or {}
+        gt = geom.get("type")
+        if gt == "Point":
+            # Fast path for the common case; the schema guarantees >= 2 numbers
+            c = geom["coordinates"]
+            flat.append(c[0])
+            flat.append(c[1])
+        elif gt:
+            flat.extend(_iter_positions(gt, geom.get("coordinates", [])))
+        if gt:
+            geom_types.add(gt)
+        total_props.update(f.get("properties") or ())
+
+    coords = np.array(flat, dtype=np.float64).reshape(-1, 2)
+    if coords.size:
+        mn, mx = coords.min(axis=0), coords.max(axis=0)
+        bbox = (float(mn[0]), float(mn[1]), float(mx[0]), float(mx[1]))
+    else:
+        bbox = (-180, -90, 180, 90)
+
+    # Serialized once: the byte length is the stored size and the
+    # string itself is what gets inserted, so create_dataset and the
+    # bulk loader don't json.dumps the same dict again.
+    serialized = _serialize(data)
+
+    # Calculate completeness
+    if total_props:
+        complete_count = sum(
+            1 for f in features
+            if all((f.get("properties") or {}).get(k) is not None for k in total_props)
+        )
+        completeness = round(complete_count / len(features), 3)
+    else:
+        completeness = 1.0
+
+    coords_e7 = encode_coords_e7(coords[:, 0], coords[:, 1])
+    if coords_e7 is None:
+        logger.warning(f"  No E7 coordinates for {dataset_id}: positions outside lng/lat range")
+
+    return {
+        "data": serialized.decode("utf-8"),
+        "file_size_bytes": len(serialized),
+        "feature_count": len(features),
+        "geometry_types": _join_geometry_types(geom_types),
+        "bbox": bbox,
+        "completeness": completeness,
+        "coords_e7": coords_e7,
+        "spatial_index": _build_spatial_index(data, dataset_id),
+    }
+
+
+@lru_cache(maxsize=1)
+def _seed_catalog() -> tuple:
+    """Load the seed catalog once per process and precompute derived fields
+    for every dataset with inline data, so repeated seed() calls only do
+    the DB work. Boundary datasets are derived at seed time after download."""
+    catalog = _load_seed_datasets()
+    for ds in catalog:
+        if ds["data"] is None:
+            continue
+        try:
+            _validate_geojson(ds["data"])
+        except fastjsonschema.JsonSchemaException:
+            continue  # reported by seed()
+        ds["_derived"] = _derive(ds["data"], ds["id"])
+    return tuple(catalog)
+
+
+SEED_CONCURRENCY = int(os.environ.get("SEED_CONCURRENCY", "4"))
+
+
+async def _resolve_boundary_data():
     """Download real polygon data for boundary datasets.
     Returns dict mapping dataset_id -> GeoJSON FeatureCollection."""
     resolved = {}
 
+    # Both downloads are independent, so fetch them concurrently
+    countries, states = await asyncio.gather(
+        asyncio.to_thread(_build_world_countries_polygon),
+        asyncio.to_thread(_build_us_states_polygon),
+    )
+
     # World Countries
-    countries = _build_world_countries_polygon()
     resolved["ds_world-countries"] = countries or CENTROID_WORLD_COUNTRIES
     if not countries:
         logger.warning("  Using centroid fallback for world countries")
 
     # US States
-    states = _build_us_states_polygon()
     resolved["ds_us-states"] = states or CENTROID_US_STATES
     if not states:
         logger.warning("  Using centroid fallback for US states")
@@ -671,18 +480,86 @@ def _resolve_boundary_data():
     return resolved
 
 
-def seed():
+def _build_row(ds: dict, data: dict) -> dict | None:
+    """Validate and derive one dataset into an insert row (None if invalid)."""
+    # Inline datasets were validated and derived when the catalog loaded
+    derived = ds.get("_derived")
+    if derived is None:
+        try:
+            _validate_geojson(data)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.error(f"  ERROR: Invalid GeoJSON for {ds['id']}: {e.message}")
+            return None
+        derived = _derive(data, ds["id"])
+
+    return dict(
+        dataset_id=ds["id"],
+        title=ds["title"],
+        description=ds["description"],
+        license=ds["license"],
+        category=ds["category"],
+        tags=ds["tags"],
+        data=derived["data"],
+        feature_count=derived["feature_count"],
+        geometry_types=derived["geometry_types"],
+        bbox_west=derived["bbox"][0],
+        bbox_south=derived["bbox"][1],
+        bbox_east=derived["bbox"][2],
+        bbox_north=derived["bbox"][3],
+        file_size_bytes=derived["file_size_bytes"],
+        uploader_email="seed@spatix.io",
+        agent_name=ds.get("creator_name", "spatix-seed"),
+        source_name=ds.get("source_name"),
+        source_url=ds.get("source_url"),
+        license_type=ds.get("license_type", ds["license"]),
+        attribution_required=ds.get("attribution_required", False),
+        commercial_use=ds.get("commercial_use", True),
+        region=ds.get("region"),
+        data_date=ds.get("data_date"),
+        update_frequency=ds.get("update_frequency"),
+        schema_def=ds.get("schema_def"),
+        completeness=derived["completeness"],
+        creator_type=ds.get("creator_type", "agent"),
+        creator_id=ds.get("creator_id", "spatix-seed"),
+        creator_name=ds.get("creator_name", "Spatix Seed"),
+        coords_e7=derived["coords_e7"],
+        spatial_index=derived["spatial_index"],
+    )
+
+
+async def _seed_one(ds: dict, data: dict, sem: asyncio.Semaphore) -> dict | None:
+    """Validate and derive one downloaded dataset off the event loop,
+    bounded by the semaphore."""
+    async with sem:
+        return await asyncio.to_thread(_build_row, ds, data)
+
+
+async def seed(force: bool = False):
     """Run the seed."""
+    signature = _seed_signature()
+    if not force and _seed_state_current(signature):
+        logger.info("Seed catalog unchanged since last run, nothing to do.")
+        return
+
     init_db()
-    seeded = 0
     skipped = 0
+    failed = 0
+    to_insert = []
 
-    # Resolve boundary polygon data (download at runtime)
+    # Resolve boundary polygon data (download at runtime) while the inline
+    # catalog is validated and derived; the two are independent.
     logger.info("Resolving boundary polygon data...")
-    boundary_data = _resolve_boundary_data()
-
-    for ds in SEED_DATASETS:
-        if dataset_exists(ds["id"]):
+    boundary_data, catalog = await asyncio.gather(
+        _resolve_boundary_data(),
+        asyncio.to_thread(_seed_catalog),
+    )
+    existing = existing_dataset_ids([ds["id"] for ds in catalog])
+
+    sem = asyncio.Semaphore(SEED_CONCURRENCY)
+    rows = []
+    pending = []
+    for ds in catalog:
+        if ds["id"] in existing:
             logger.info(f"  skip (exists): {ds['id']}")
             skipped += 1
             continue
@@ -691,69 +568,30 @@ def seed():
         data = boundary_data.get(ds["id"]) if ds["data"] is None else ds["data"]
         if data is None:
             logger.error(f"  ERROR: No data for {ds['id']}, skipping")
+            failed += 1
             continue
 
-        features = data.get("features", [])
-        bbox_w, bbox_s, bbox_e, bbox_n = _calculate_bbox(data)
-
-        geom_types = set()
-        for f in features:
-            gt = f.get("geometry", {}).get("type")
-            if gt:
-                geom_types.add(gt)
-
-        # Calculate completeness
-        total_props = set()
-        for f in features:
-            for k in (f.get("properties") or {}).keys():
-                total_props.add(k)
-        if total_props:
-            complete_count = sum(
-                1 for f in features
-                if all((f.get("properties") or {}).get(k) is not None for k in total_props)
-            )
-            completeness = round(complete_count / len(features), 3)
+        if "_derived" in ds:
+            # Inline data was already derived with the catalog
+            rows.append(_build_row(ds, data))
         else:
-            completeness = 1.0
-
-        create_dataset(
-            dataset_id=ds["id"],
-            title=ds["title"],
-            description=ds["description"],
-            license=ds["license"],
-            category=ds["category"],
-            tags=ds["tags"],
-            data=data,
-            feature_count=len(features),
-            geometry_types=",".join(sorted(geom_types)),
-            bbox_west=bbox_w,
-            bbox_south=bbox_s,
-            bbox_east=bbox_e,
-            bbox_north=bbox_n,
-            file_size_bytes=len(json.dumps(data)),
-            uploader_email="seed@spatix.io",
-            agent_name=ds.get("creator_name", "spatix-seed"),
-            source_name=ds.get("source_name"),
-            source_url=ds.get("source_url"),
-            license_type=ds.get("license_type", ds["license"]),
-            attribution_required=ds.get("attribution_required", False),
-            commercial_use=ds.get("commercial_use", True),
-            region=ds.get("region"),
-            data_date=ds.get("data_date"),
-            update_frequency=ds.get("update_frequency"),
-            schema_def=ds.get("schema_def"),
-            completeness=completeness,
-            creator_type=ds.get("creator_type", "agent"),
-            creator_id=ds.get("creator_id", "spatix-seed"),
-            creator_name=ds.get("creator_name", "Spatix Seed"),
-        )
+            pending.append(asyncio.create_task(_seed_one(ds, data, sem)))
 
-        geom_info = ",".join(sorted(geom_types))
-        logger.info(f"  seeded: {ds['id']} ({len(features)} features, {geom_info})")
-        seeded += 1
+    rows += await asyncio.gather(*pending)
+    for row in rows:
+        if row is None:
+            failed += 1
+            continue
+        to_insert.append(row)
+        logger.info(
+            f"  queued: {row['dataset_id']} ({row['feature_count']} features, {row['geometry_types']})"
+        )
 
+    seeded = bulk_create_datasets(to_insert)
     logger.info(f"Done. Seeded {seeded}, skipped {skipped}.")
+    if not failed:
+        _write_seed_state(signature)
 
 
 if __name__ == "__main__":
-    seed()
+    asyncio.run(seed(force="--force" in sys.argv))
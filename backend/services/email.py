@@ -4,9 +4,13 @@ Supports: Resend (recommended), SendGrid, or SMTP
 """
 
 import os
+import logging
 import httpx
+import orjson
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 # Config - set one of these
 RESEND_API_KEY = os.environ.get("RESEND_API_KEY")
 SENDGRID_API_KEY = os.environ.get("SENDGRID_API_KEY")
@@ -19,10 +23,41 @@ FROM_EMAIL = os.environ.get("FROM_EMAIL", "noreply@spatix.io")
 FROM_NAME = os.environ.get("FROM_NAME", "Spatix")
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "https://spatix.io")
 
+_FROM_HEADER = f"{FROM_NAME} <{FROM_EMAIL}>"
+
+# Shared client so provider sends reuse pooled TLS connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def close_email_client():
+    """Close the shared HTTP client (call on app shutdown)"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def send_email(to: str, subject: str, html: str, text: Optional[str] = None,
+                     prefer_html: bool = True):
+    """Send email using configured provider
+
+    With prefer_html=False and a text body, the HTML part is left out entirely.
+    """
+    if not prefer_html and text:
+        html = None
 
-async def send_email(to: str, subject: str, html: str, text: Optional[str] = None):
-    """Send email using configured provider"""
-    
     if RESEND_API_KEY:
         await send_via_resend(to, subject, html, text)
     elif SENDGRID_API_KEY:
@@ -30,90 +65,187 @@ async def send_email(to: str, subject: str, html: str, text: Optional[str] = Non
     elif SMTP_HOST:
         await send_via_smtp(to, subject, html, text)
     else:
-        print(f"[EMAIL] No provider configured. Would send to {to}: {subject}")
+        logger.info("[EMAIL] would send to %s: %s", to, subject)
         # In dev, just log the email
         return
 
 
+async def send_emails_batch(messages: list[dict]):
+    """Send many emails using provider batch APIs where available.
+
+    Each message is a dict with "to", "subject", "html" and optional "text".
+    """
+    if not messages:
+        return
+
+    if RESEND_API_KEY:
+        await send_batch_via_resend(messages)
+    elif SENDGRID_API_KEY:
+        await send_batch_via_sendgrid(messages)
+    elif SMTP_HOST:
+        await send_batch_via_smtp(messages)
+    else:
+        for m in messages:
+            logger.info("[EMAIL] would send to %s: %s", m["to"], m["subject"])
+
+
+def _resend_payload(to: str, subject: str, html: Optional[str], text: Optional[str] = None) -> dict:
+    payload = {
+        "from": _FROM_HEADER,
+        "to": [to],
+        "subject": subject,
+        "text": text or ""
+    }
+    if html is not None:
+        payload["html"] = html
+    return payload
+
+
 async def send_via_resend(to: str, subject: str, html: str, text: Optional[str] = None):
     """Send email via Resend API"""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.resend.com/emails",
+    resp = await _get_client().post(
+        "https://api.resend.com/emails",
+        headers={
+            "Authorization": f"Bearer {RESEND_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        content=orjson.dumps(_resend_payload(to, subject, html, text))
+    )
+
+    if resp.status_code not in (200, 201):
+        raise Exception(f"Resend error: {resp.status_code} {resp.text}")
+
+
+RESEND_BATCH_MAX = 100  # Resend's per-request limit for /emails/batch
+
+
+async def send_batch_via_resend(messages: list[dict]):
+    """Send emails via Resend's batch endpoint, up to 100 per request"""
+    for i in range(0, len(messages), RESEND_BATCH_MAX):
+        chunk = messages[i:i + RESEND_BATCH_MAX]
+        resp = await _get_client().post(
+            "https://api.resend.com/emails/batch",
             headers={
                 "Authorization": f"Bearer {RESEND_API_KEY}",
                 "Content-Type": "application/json"
             },
-            json={
-                "from": f"{FROM_NAME} <{FROM_EMAIL}>",
-                "to": [to],
-                "subject": subject,
-                "html": html,
-                "text": text or ""
-            }
+            content=orjson.dumps([
+                _resend_payload(m["to"], m["subject"], m["html"], m.get("text"))
+                for m in chunk
+            ])
         )
-        
+
         if resp.status_code not in (200, 201):
             raise Exception(f"Resend error: {resp.status_code} {resp.text}")
 
 
 async def send_via_sendgrid(to: str, subject: str, html: str, text: Optional[str] = None):
     """Send email via SendGrid API"""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://api.sendgrid.com/v3/mail/send",
-            headers={
-                "Authorization": f"Bearer {SENDGRID_API_KEY}",
-                "Content-Type": "application/json"
-            },
-            json={
-                "personalizations": [{"to": [{"email": to}]}],
-                "from": {"email": FROM_EMAIL, "name": FROM_NAME},
-                "subject": subject,
-                "content": [
-                    {"type": "text/plain", "value": text or ""},
-                    {"type": "text/html", "value": html}
-                ]
-            }
+    await _post_sendgrid(html, text, [{"to": [{"email": to}]}], subject)
+
+
+SENDGRID_PERSONALIZATIONS_MAX = 1000  # SendGrid's per-request limit
+
+
+async def send_batch_via_sendgrid(messages: list[dict]):
+    """Send emails via SendGrid, one request per distinct body.
+
+    SendGrid shares content across personalizations, so messages are grouped
+    by (html, text); each recipient gets its own personalization and subject.
+    """
+    groups: dict[tuple, list] = {}
+    for m in messages:
+        groups.setdefault((m["html"], m.get("text")), []).append(
+            {"to": [{"email": m["to"]}], "subject": m["subject"]}
         )
-        
-        if resp.status_code not in (200, 201, 202):
-            raise Exception(f"SendGrid error: {resp.status_code} {resp.text}")
+
+    for (html, text), personalizations in groups.items():
+        for i in range(0, len(personalizations), SENDGRID_PERSONALIZATIONS_MAX):
+            chunk = personalizations[i:i + SENDGRID_PERSONALIZATIONS_MAX]
+            await _post_sendgrid(html, text, chunk, chunk[0]["subject"])
+
+
+def _sendgrid_content(html: Optional[str], text: Optional[str]) -> list:
+    content = [{"type": "text/plain", "value": text or ""}]
+    if html is not None:
+        content.append({"type": "text/html", "value": html})
+    return content
+
+
+async def _post_sendgrid(html: Optional[str], text: Optional[str], personalizations: list, subject: str):
+    resp = await _get_client().post(
+        "https://api.sendgrid.com/v3/mail/send",
+        headers={
+            "Authorization": f"Bearer {SENDGRID_API_KEY}",
+            "Content-Type": "application/json"
+        },
+        content=orjson.dumps({
+            "personalizations": personalizations,
+            "from": {"email": FROM_EMAIL, "name": FROM_NAME},
+            "subject": subject,
+            "content": _sendgrid_content(html, text)
+        })
+    )
+
+    if resp.status_code not in (200, 201, 202):
+        raise Exception(f"SendGrid error: {resp.status_code} {resp.text}")
+
+
+def _build_smtp_message(to: str, subject: str, html: Optional[str], text: Optional[str] = None):
+    from email.message import EmailMessage
+
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = _FROM_HEADER
+    msg["To"] = to
+
+    if html is None:
+        msg.set_content(text)
+    elif text:
+        msg.set_content(text)
+        msg.add_alternative(html, subtype="html")
+    else:
+        msg.set_content(html, subtype="html")
+    return msg
+
+
+def _smtp_auth() -> dict:
+    return {"username": SMTP_USER, "password": SMTP_PASS} if SMTP_USER and SMTP_PASS else {}
 
 
 async def send_via_smtp(to: str, subject: str, html: str, text: Optional[str] = None):
-    """Send email via SMTP (synchronous, wrapped)"""
-    import smtplib
-    from email.mime.text import MIMEText
-    from email.mime.multipart import MIMEMultipart
-    import asyncio
-    
-    def _send():
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = f"{FROM_NAME} <{FROM_EMAIL}>"
-        msg["To"] = to
-        
-        if text:
-            msg.attach(MIMEText(text, "plain"))
-        msg.attach(MIMEText(html, "html"))
-        
-        with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as server:
-            server.starttls()
-            if SMTP_USER and SMTP_PASS:
-                server.login(SMTP_USER, SMTP_PASS)
-            server.sendmail(FROM_EMAIL, to, msg.as_string())
-    
-    await asyncio.to_thread(_send)
+    """Send email via SMTP (native asyncio, no worker thread)"""
+    import aiosmtplib
+
+    await aiosmtplib.send(
+        _build_smtp_message(to, subject, html, text),
+        sender=FROM_EMAIL,
+        recipients=[to],
+        hostname=SMTP_HOST,
+        port=SMTP_PORT,
+        start_tls=True,
+        **_smtp_auth(),
+    )
+
+
+async def send_batch_via_smtp(messages: list[dict]):
+    """Send emails over a single SMTP session"""
+    import aiosmtplib
+
+    async with aiosmtplib.SMTP(hostname=SMTP_HOST, port=SMTP_PORT, start_tls=True,
+                               **_smtp_auth()) as smtp:
+        for m in messages:
+            await smtp.send_message(
+                _build_smtp_message(m["to"], m["subject"], m["html"], m.get("text")),
+                sender=FROM_EMAIL,
+                recipients=[m["to"]],
+            )
 
 
 # ============ Email Templates ============
 
-async def send_verification_email(to: str, token: str):
-    """Send email verification link"""
-    verify_url = f"{FRONTEND_URL}/auth/verify?token={token}"
-    
-    html = f"""
+# Built once at import; only the link varies per send.
+_VERIFY_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -133,7 +265,7 @@ async def send_verification_email(to: str, token: str):
             <p style="margin: 0 0 24px 0; color: #64748b;">
                 Thanks for signing up! Click the button below to verify your email address and activate your account.
             </p>
-            <a href="{verify_url}" style="display: inline-block; background: #2563eb; color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; font-weight: 500;">
+            <a href="{url}" style="display: inline-block; background: #2563eb; color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; font-weight: 500;">
                 Verify Email
             </a>
         </div>
@@ -146,30 +278,23 @@ async def send_verification_email(to: str, token: str):
         
         <p style="color: #94a3b8; font-size: 12px; margin: 0;">
             Button not working? Copy and paste this link:<br>
-            <a href="{verify_url}" style="color: #2563eb;">{verify_url}</a>
+            <a href="{url}" style="color: #2563eb;">{url}</a>
         </p>
     </body>
     </html>
     """
-    
-    text = f"""
+
+_VERIFY_TEXT = """
 Verify your Spatix email
 
 Thanks for signing up! Click the link below to verify your email address:
 
-{verify_url}
+{url}
 
 This link expires in 24 hours. If you didn't create an account, you can ignore this email.
     """
-    
-    await send_email(to, "Verify your Spatix account", html, text)
 
-
-async def send_password_reset_email(to: str, token: str):
-    """Send password reset link"""
-    reset_url = f"{FRONTEND_URL}/reset-password?token={token}"
-    
-    html = f"""
+_RESET_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -189,7 +314,7 @@ async def send_password_reset_email(to: str, token: str):
             <p style="margin: 0 0 24px 0; color: #64748b;">
                 We received a request to reset your password. Click the button below to choose a new one.
             </p>
-            <a href="{reset_url}" style="display: inline-block; background: #2563eb; color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; font-weight: 500;">
+            <a href="{url}" style="display: inline-block; background: #2563eb; color: white; text-decoration: none; padding: 12px 24px; border-radius: 8px; font-weight: 500;">
                 Reset Password
             </a>
         </div>
@@ -202,20 +327,40 @@ async def send_password_reset_email(to: str, token: str):
         
         <p style="color: #94a3b8; font-size: 12px; margin: 0;">
             Button not working? Copy and paste this link:<br>
-            <a href="{reset_url}" style="color: #2563eb;">{reset_url}</a>
+            <a href="{url}" style="color: #2563eb;">{url}</a>
         </p>
     </body>
     </html>
     """
-    
-    text = f"""
+
+_RESET_TEXT = """
 Reset your Spatix password
 
 We received a request to reset your password. Click the link below to choose a new one:
 
-{reset_url}
+{url}
 
 This link expires in 1 hour. If you didn't request this, you can safely ignore this email.
     """
+
+
+async def send_verification_email(to: str, token: str):
+    """Send email verification link"""
+    verify_url = f"{FRONTEND_URL}/auth/verify?token={token}"
+    
+    html = _VERIFY_HTML.format(url=verify_url)
+    
+    text = _VERIFY_TEXT.format(url=verify_url)
+    
+    await send_email(to, "Verify your Spatix account", html, text)
+
+
+async def send_password_reset_email(to: str, token: str):
+    """Send password reset link"""
+    reset_url = f"{FRONTEND_URL}/reset-password?token={token}"
+    
+    html = _RESET_HTML.format(url=reset_url)
+    
+    text = _RESET_TEXT.format(url=reset_url)
     
     await send_email(to, "Reset your Spatix password", html, text)